@@ -0,0 +1,20 @@
+import msgspec
+from typing import Tuple
+
+# Pydantic validates Cart (problem5.py) at the boundary; after that, internal stages
+# can pass around this immutable mirror, which has no __dict__ and encodes straight
+# to JSON. Needs msgspec (pip install msgspec); problem5.py itself only needs pydantic.
+
+
+class CartFast(msgspec.Struct, frozen=True, array_like=True):
+    items: Tuple[str, ...] = ()
+    total: float = 0.0
+
+
+def from_cart(cart):
+    # Struct constructors don't coerce, so turn the validated list into a tuple here
+    return CartFast(items=tuple(cart.items), total=cart.total)
+
+
+fast = CartFast(items=("notebook", "ruler"), total=120.0)
+print(msgspec.json.encode(fast))
@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Annotated
 
 # Create a model Book with:
@@ -8,6 +8,13 @@ from typing import Annotated
 
 
 class Book(BaseModel):
+    model_config = ConfigDict(
+        extra="ignore",
+        frozen=True,
+        revalidate_instances="never",
+        validate_default=False,
+    )
+
     title: Annotated[str, Field(min_length=3)]
     pages: Annotated[int, Field(gt=0)]
     price: Annotated[float, Field(ge=10, le=1000)]
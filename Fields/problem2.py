@@ -1,5 +1,4 @@
-from pydantic import BaseModel, Field
-from typing import Required, Optional
+from pydantic import BaseModel, ConfigDict, Field
 
 # Create a model UserProfile with:
 # username → string, min length 4, max length 20
@@ -11,9 +10,16 @@ from typing import Required, Optional
 
 
 class UserProfile(BaseModel):
+    model_config = ConfigDict(
+        extra="ignore",
+        frozen=True,
+        revalidate_instances="never",
+        validate_default=False,
+    )
+
     username: str = Field(min_length=4, max_length=20)
     email: str  # required
-    bio: Optional[str] = Field(default="", max_length=150)
+    bio: str = Field(default="", max_length=150)
     age: int = Field(default=18, ge=13)
 
 
@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, StringConstraints
 from typing import Annotated
 
 # Create a model Vehicle with:
@@ -8,7 +8,23 @@ from typing import Annotated
 
 
 class Vehicle(BaseModel):
-    plate_number: Annotated[str, Field(pattern=r"^[A-Z]{2}\d{2}[A-Z]{2}\d{4}$")]
+    model_config = ConfigDict(
+        extra="ignore",
+        frozen=True,
+        revalidate_instances="never",
+        validate_default=False,
+    )
+
+    # length is checked before the pattern, so the regex only runs on 10-char input
+    plate_number: Annotated[
+        str,
+        StringConstraints(
+            strip_whitespace=True,
+            min_length=10,
+            max_length=10,
+            pattern=r"^[A-Z]{2}[0-9]{2}[A-Z]{2}[0-9]{4}$",
+        ),
+    ]
     model_name: Annotated[str, Field(min_length=2, max_length=30)]
     price: Annotated[float, Field(gt=50000)]
 
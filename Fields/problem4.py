@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 # Create a model Employee with:
 # emp_id → int, positive, with description="Employee ID"
@@ -8,6 +8,15 @@ from pydantic import BaseModel, Field
 
 
 class Employee(BaseModel):
+    model_config = ConfigDict(
+        extra="ignore",
+        frozen=True,
+        revalidate_instances="never",
+        validate_default=False,
+        strict=True,
+        from_attributes=False,
+    )
+
     emp_id: int = Field(gt=0, description="Employee ID", examples=[202201])
     name: str = Field(min_length=2, examples=["harsh patel"])
     salary: float = Field(ge=10000, examples=[120000])
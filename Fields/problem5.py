@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 from typing import List
 
 # Create a model Cart with:
@@ -7,6 +7,13 @@ from typing import List
 
 
 class Cart(BaseModel):
+    model_config = ConfigDict(
+        extra="ignore",
+        frozen=True,
+        revalidate_instances="never",
+        validate_default=False,
+    )
+
     items: List[str] = Field(default_factory=list)
     total: float = Field(default=0.0, ge=0)
 
@@ -17,3 +24,10 @@ class Cart(BaseModel):
 
 c1 = Cart(items=["eraser", "pencil"], total=2323)
 print(c1)
+
+# For many carts, validate the whole list in one call instead of one Cart(...) per row.
+CART_LIST = TypeAdapter(List[Cart])
+
+carts = CART_LIST.validate_python([{"items": ["pen"], "total": 10}, {"total": 0}])
+print(carts)
+print(CART_LIST.dump_json(carts))
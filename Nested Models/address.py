@@ -0,0 +1,10 @@
+from pydantic import BaseModel, ConfigDict, Field
+
+# Shared by p1.py and p3.py; p1.py extends it with a required street.
+
+
+class Address(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="forbid", revalidate_instances="never")
+
+    city: str
+    zip: str = Field(..., pattern=r"\d{6}")
@@ -1,21 +1,22 @@
-from pydantic import BaseModel, Field, EmailStr
+from pydantic import BaseModel, EmailStr
 
+from address import Address
 
-class Address(BaseModel):
+
+# a User's address must also have a street
+class StreetAddress(Address):
     street: str
-    city: str
-    zip: str = Field(..., pattern=r"\d{6}")
 
 
 class User(BaseModel):
     name: str
     email: EmailStr
-    address: Address
+    address: StreetAddress
 
 
 u1 = User(
     name="Harsh Patel",
     email="harsh@gmail.com",
-    address=Address(street="MG Road", city="Pune", zip="411001"),
+    address=StreetAddress(street="MG Road", city="Pune", zip="411001"),
 )
 print(u1)
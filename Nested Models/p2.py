@@ -1,12 +1,13 @@
-from pydantic import BaseModel, Field, model_validator
-from typing import List
+from pydantic import BaseModel, Field, ValidationInfo, field_validator
+from typing import Tuple
+from operator import attrgetter
 
 # Create models:
 # Item → name, price (> 0)
-# Order → order_id, items: list[Item], total: float
+# Order → order_id, items: tuple[Item, ...], total: float
 # Validate that:
 # total ≥ sum of item prices
-# (Hint: use model_validator for cross-field validation)
+# (Hint: a field_validator on total can read the validated items from info.data)
 
 
 class Item(BaseModel):
@@ -16,22 +17,26 @@ class Item(BaseModel):
 
 class Order(BaseModel):
     order_id: int
-    items: List[Item]
+    items: Tuple[Item, ...]
     total: float
 
-    @model_validator(mode="after")
-    def check_total(self):
-        total_price = sum(item.price for item in self.items)
-        if self.total < total_price:
+    # total is declared after items, so the validated items are already in info.data
+    @field_validator("total")
+    def check_total(cls, v, info: ValidationInfo):
+        items = info.data.get("items")
+        if items is None:  # items failed validation, its error is reported on its own
+            return v
+        total_price = sum(map(attrgetter("price"), items))
+        if v < total_price:
             raise ValueError(
-                f"Total {self.total} is less than the sum of items prices {total_price}"
+                f"Total {v} is less than the sum of items prices {total_price}"
             )
-        return self
+        return v
 
 
 o2 = Order(
     order_id=102,
-    items=[Item(name="Book", price=200), Item(name="Pen", price=50)],
+    items=(Item(name="Book", price=200), Item(name="Pen", price=50)),
     total=100,
 )
 
@@ -1,16 +1,13 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel
 from typing import Optional
 
+from address import Address
+
 # Make a model UserProfile that has:
 # name, age, address: Address | None
 # Ensure address can be missing but if present, its city and zip are required.
 
 
-class Address(BaseModel):
-    city: str
-    zip: str = Field(..., pattern=r"\d{6}")
-
-
 class UserProfile(BaseModel):
     name: str
     age: int
@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field
 
 # Create a Person model with fields:
 # name: str
@@ -10,13 +10,7 @@ from pydantic import BaseModel, Field, field_validator
 
 class Person(BaseModel):
     name: str
-    age: int
-
-    @field_validator("age")
-    def check(cls, value):
-        if not (1 <= value <= 120):
-            raise ValueError("the age must be between 1 and 120")
-        return value
+    age: int = Field(ge=1, le=120)
 
 
 p1 = Person(name="harsh", age=120)
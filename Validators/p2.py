@@ -1,23 +1,18 @@
-from pydantic import BaseModel, Field, model_validator
+from pydantic import BaseModel, StringConstraints
+from typing import Annotated
 
 # Create a Product model with:
 # name: str
 # price: float
-# Use a before validator to:
-# Automatically strip whitespace from name
-# Convert price to float even if user passes "499.99" as a string
+# Make sure that:
+# whitespace is automatically stripped from name
+# price is converted to float even if user passes "499.99" as a string
+# (both are handled by pydantic's own constraints, no before validator needed)
 
 
 class Product(BaseModel):
-    name: str
-    price: float
-
-    @model_validator(mode="before")
-    def process(cls, data):
-        if isinstance(data, dict):
-            data["name"] = data["name"].strip()
-            data["price"] = float(data["price"])
-        return data
+    name: Annotated[str, StringConstraints(strip_whitespace=True)]
+    price: float  # lax float validation already parses "499.99"
 
 
 p1 = Product(name="  Laptop  ", price="499.99")
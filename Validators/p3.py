@@ -1,23 +1,20 @@
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, StringConstraints
+from typing import Annotated
 
 # Create a Student model with:
 # roll_no: int
 # name: str
 # grade: str
-# Use one field validator that runs on both name and grade,
-# and ensures neither are empty or blank.
+# Use one shared StringConstraints alias (NonBlankStr) for both name and grade,
+# so neither can be empty or blank; stored values are stripped of whitespace.
+
+NonBlankStr = Annotated[str, StringConstraints(strip_whitespace=True, min_length=1)]
 
 
 class Student(BaseModel):
     roll_no: int
-    name: str
-    grade: str
-
-    @field_validator("name", "grade")
-    def validate_not_blank(cls, v):
-        if not v or not v.strip():
-            raise ValueError("Field cannot be empty or blank")
-        return v
+    name: NonBlankStr
+    grade: NonBlankStr
 
 
 s1 = Student(roll_no=1, name="Harsh", grade="A")
@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field, model_validator
+from pydantic import BaseModel, ConfigDict, model_validator
 
 # Create a Register model with:
 # password: str
@@ -8,12 +8,16 @@ from pydantic import BaseModel, Field, model_validator
 
 
 class Register(BaseModel):
+    model_config = ConfigDict(str_strip_whitespace=False)
+
     password: str
     confirm_password: str
 
     @model_validator(mode="after")
-    def validate_pass(cls, self):
-        if self.password != self.confirm_password:
+    def validate_pass(self):
+        password, confirm = self.password, self.confirm_password
+        # identity check first: the same str object needs no character comparison
+        if password is not confirm and password != confirm:
             raise ValueError("Passwords do not match")
         return self
 
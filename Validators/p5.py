@@ -1,14 +1,14 @@
-from pydantic import BaseModel, Field, model_validator, field_validator
+from pydantic import BaseModel, model_validator
 
 
 # Create a Transaction model with:
 # sender_balance: float
 # amount: float
 # receiver_balance: float
-# Validations:
-# Field validator: amount must be > 0
-# Model validator: ensure sender_balance - amount ≥ 0,
-# else raise "Insufficient funds"
+# Validations (a single model_validator checks both):
+# amount must be > 0, else raise "Amount must be > 0"
+# sender_balance - amount ≥ 0, else raise "Insufficient funds"
+# (errors are reported on the model, not on the amount field)
 
 
 class Transaction(BaseModel):
@@ -16,15 +16,13 @@ class Transaction(BaseModel):
     amount: float
     receiver_balance: float
 
-    @field_validator("amount")
-    def amount_check(cls, v):
-        if v <= 0:
-            raise ValueError("Amount must be > 0")
-        return v
-
+    # one validator for both checks instead of a field_validator + model_validator pair
     @model_validator(mode="after")
-    def validate_sender_balance(cls, self):
-        if (self.sender_balance - self.amount) < 0:
+    def validate_transaction(self):
+        balance, amount = self.sender_balance, self.amount
+        if amount <= 0:
+            raise ValueError("Amount must be > 0")
+        if balance < amount:
             raise ValueError("Insufficient funds")
         return self
 
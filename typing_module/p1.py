@@ -1,5 +1,5 @@
-from pydantic import BaseModel, Field, model_validator
-from typing import Annotated, List, Optional
+from pydantic import BaseModel, Field, TypeAdapter, computed_field
+from typing import Annotated, List
 
 # Create a model ShoppingList with:
 # items: list of strings, must have at least 2 items
@@ -8,13 +8,18 @@ from typing import Annotated, List, Optional
 
 class ShoppingList(BaseModel):
     items: Annotated[List[str], Field(min_length=2)]
-    total_items: Optional[int] = None
 
-    @model_validator(mode="after")
-    def set_total_items(self):
-        self.total_items = len(self.items)
-        return self
+    @computed_field
+    @property
+    def total_items(self) -> int:
+        return len(self.items)
 
 
 s = ShoppingList(items=["milk", "bread", "butter"])
 print(s)
+
+# For many lists, validate them all in one call instead of one ShoppingList(...) each.
+SHOPPING_LISTS = TypeAdapter(List[ShoppingList])
+
+lists = SHOPPING_LISTS.validate_python([{"items": ["eggs", "rice"]}])
+print(lists)
@@ -1,16 +1,36 @@
-from pydantic import BaseModel, Field
-from typing import Union, Dict
+from pydantic import BaseModel, ConfigDict, Field
+from typing import Dict
 
 # Create model Settings with:
-# config: dict where key = string, value = int or bool
-# Example:
-# {"retries": 3, "verbose": True} should be valid.
+# int_config: dict where key = string, value = int
+# bool_config: dict where key = string, value = bool
+# Settings.from_flat splits one flat dict into the two, so
+# Settings.from_flat({"retries": 3, "verbose": True}) should be valid.
 
 
+# bool is a subclass of int, so a Union[int, bool] value has to be tried against
+# both branches. Keeping ints and bools in separate strict dicts avoids that.
 class Settings(BaseModel):
-    config: Dict[str, Union[int, bool]]
+    model_config = ConfigDict(strict=True, extra="forbid")
+
+    int_config: Dict[str, int] = Field(default_factory=dict)
+    bool_config: Dict[str, bool] = Field(default_factory=dict)
+
+    @classmethod
+    def from_flat(cls, config):
+        ints, bools = {}, {}
+        for key, value in config.items():
+            if isinstance(value, bool):
+                bools[key] = value
+            elif isinstance(value, int):
+                ints[key] = value
+            else:
+                raise TypeError(
+                    f"config[{key!r}] must be int or bool, got {type(value).__name__}"
+                )
+        return cls(int_config=ints, bool_config=bools)
 
 
 d1 = {"retries": 3, "verbose": True}
-s1 = Settings(config=d1)
+s1 = Settings.from_flat(d1)
 print(s1)
@@ -1,9 +1,9 @@
-from pydantic import BaseModel, Field, EmailStr
-from typing import List, Dict, Union, Optional, Annotated
+from pydantic import BaseModel, Field, EmailStr, TypeAdapter
+from typing import List, Dict, Tuple, Union, Optional, Annotated
 
 # Create model Profile with:
 # username: str
-# skills: list of strings (min 1)
+# skills: tuple of strings (min 1)
 # settings: dict with keys = str, values = str or int
 # contact: optional dict with phone and email (both strings)
 
@@ -15,15 +15,26 @@ class Contact(BaseModel):
 
 class Profile(BaseModel):
     username: str
-    skills: Annotated[List[str], Field(min_length=1)]
+    skills: Annotated[Tuple[str, ...], Field(min_length=1)]
     settings: Dict[str, Union[str, int]]
     contact: Optional[Contact] = None
 
 
 p = Profile(
     username="harsh",
-    skills=["Python", "Docker"],
+    skills=("Python", "Docker"),
     settings={"theme": "dark", "level": 5},
     contact=Contact(phone="9876543210", email="harsh@example.com"),
 )
 print(p)
+
+# For many profiles, validate the whole list in one call, not one Profile(...) per row.
+PROFILE_LIST = TypeAdapter(List[Profile])
+
+profiles = PROFILE_LIST.validate_python(
+    [
+        {"username": "raj", "skills": ["Go"], "settings": {"theme": "light"}},
+        {"username": "asha", "skills": ["SQL", "Excel"], "settings": {"level": 2}},
+    ]
+)
+print(profiles)